@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pyld import jsonld
 from pyshacl import validate as shacl_validate
 import json
@@ -41,6 +42,41 @@ def load_file(path_or_url, started=False, http_kwargs={}):
     return data
 
 
+@lru_cache(maxsize=8)
+def _parse_shapes(shape_file_path, mtime):
+    import rdflib as rl
+
+    shapes = rl.Graph()
+    shapes.parse(shape_file_path, format="turtle")
+    return shapes
+
+
+def _load_shapes(shape_file_path):
+    """Parse a SHACL turtle file once and reuse the graph across validations.
+
+    The cache is keyed on the absolute path and modification time of the
+    file, so changing directory or editing the shapes file yields a fresh
+    graph.
+
+    .. warning:: The returned graph is shared by every caller and must not
+       be mutated. pyshacl only adds a couple of built-in RDFS/OWL axioms
+       to it on the first run, which does not change later results.
+
+    Parameters
+    ----------
+    shape_file_path : str
+        SHACL file for the document
+
+    Returns
+    -------
+    shapes: rdflib.Graph
+        Graph holding the SHACL shapes
+
+    """
+    shape_file_path = os.path.abspath(shape_file_path)
+    return _parse_shapes(shape_file_path, os.path.getmtime(shape_file_path))
+
+
 def validate_data(data, shape_file_path):
     """Validate an expanded jsonld document against a shape.
 
@@ -62,12 +98,10 @@ def validate_data(data, shape_file_path):
     kwargs = {"algorithm": "URDNA2015", "format": "application/n-quads"}
     normalized = jsonld.normalize(data, kwargs)
     data_file_format = "nquads"
-    shape_file_format = "turtle"
     conforms, v_graph, v_text = shacl_validate(
         normalized,
-        shacl_graph=shape_file_path,
+        shacl_graph=_load_shapes(shape_file_path),
         data_graph_format=data_file_format,
-        shacl_graph_format=shape_file_format,
         inference="rdfs",
         debug=False,
         serialize_report_graph=True,
@@ -7,6 +7,9 @@ class Activity(SchemaBase):
     """
 
     schema_type = "reproschema:Activity"
+    schema_order = SchemaBase.schema_order + ("ui",)
+    ui_order = ("shuffle", "order", "addProperties")
+    __slots__ = ("URI",)
 
     def __init__(self, version=None):
         super().__init__(version)
@@ -38,30 +41,21 @@ class Activity(SchemaBase):
 
         # update the content of the activity schema with new item
 
-        item_info["URI"] = "items/" + item_info["name"]
+        name = item_info["name"]
+        URI = "items/" + name
+        item_info["URI"] = URI
 
         append_to_activity = {
-            "variableName": item_info["name"],
-            "isAbout": item_info["URI"],
+            "variableName": name,
+            "isAbout": URI,
             "isVis": item_info["visibility"],
             "valueRequired": False,
         }
 
-        self.schema["ui"]["order"].append(item_info["URI"])
-        self.schema["ui"]["addProperties"].append(append_to_activity)
+        ui = self.schema["ui"]
+        ui["order"].append(URI)
+        ui["addProperties"].append(append_to_activity)
 
     def sort(self):
-        schema_order = [
-            "@context",
-            "@type",
-            "@id",
-            "prefLabel",
-            "description",
-            "schemaVersion",
-            "version",
-            "ui",
-        ]
-        self.sort_schema(schema_order)
-
-        ui_order = ["shuffle", "order", "addProperties"]
-        self.sort_ui(ui_order)
+        self.sort_schema(self.schema_order)
+        self.sort_ui(self.ui_order)
@@ -1,5 +1,51 @@
-import json
+import functools
 import os
+from pathlib import Path
+
+# orjson (``pip install reproschema[fast]``) is used when available. The stdlib
+# fallback produces the same layout for regular schemas, but differs on edge
+# cases: orjson rejects integers wider than 64 bits and writes NaN as null.
+try:
+    import orjson
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+    load_json_bytes = json.loads
+else:
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    load_json_bytes = orjson.loads
+
+
+URL = "https://raw.githubusercontent.com/ReproNim/reproschema/"
+DEFAULT_VERSION = "1.0.0-rc2"
+DEFAULT_LANG = "en"
+SCHEMA_SUFFIX = "_schema"
+
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=8)
+def _context_for(version):
+    return URL + version + "/contexts/generic"
+
+
+def reorder_dict_skip_missing(old_dict, key_list):
+    """
+    reorders dictionary according to ``key_list``
+    removing any key with no associated value
+    """
+    new_dict = {}
+    for k in key_list:
+        v = old_dict.get(k, _MISSING)
+        if v is not _MISSING:
+            new_dict[k] = v
+    return new_dict
 
 
 class SchemaBase:
@@ -8,25 +54,37 @@ class SchemaBase:
     """
 
     schema_type = None
+    schema_order = (
+        "@context",
+        "@type",
+        "@id",
+        "prefLabel",
+        "description",
+        "schemaVersion",
+        "version",
+    )
+    __slots__ = ("schema", "schema_file", "dir")
 
     def __init__(self, version):
 
-        URL = "https://raw.githubusercontent.com/ReproNim/reproschema/"
-        VERSION = version or "1.0.0-rc2"
+        VERSION = version or DEFAULT_VERSION
 
         self.schema = {
-            "@context": URL + VERSION + "/contexts/generic",
+            "@context": _context_for(VERSION),
             "@type": self.schema_type,
             "schemaVersion": VERSION,
             "version": "0.0.1",
         }
 
     def set_filename(self, name):
-        self.schema_file = name + "_schema"
-        self.schema["@id"] = name + "_schema"
+        schema_file = name + SCHEMA_SUFFIX
+        self.schema_file = schema_file
+        self.schema["@id"] = schema_file
 
     def get_name(self):
-        return self.schema_file.replace("_schema", "")
+        if self.schema_file.endswith(SCHEMA_SUFFIX):
+            return self.schema_file[: -len(SCHEMA_SUFFIX)]
+        return self.schema_file
 
     def get_filename(self):
         return self.schema_file
@@ -43,22 +101,21 @@ class SchemaBase:
     def __set_defaults(self, name):
         self.set_filename(name)
         self.set_directory(name)
-        self.set_pref_label(name.replace("_", " "))
-        self.set_description(name.replace("_", " "))
+        label = name.replace("_", " ")
+        self.set_pref_label(label)
+        self.set_description(label)
 
     def sort_schema(self, schema_order):
-
-        reordered_dict = {k: self.schema[k] for k in schema_order}
-        self.schema = reordered_dict
+        self.schema = reorder_dict_skip_missing(self.schema, schema_order)
 
     def sort_ui(self, ui_order):
-
-        reordered_dict = {k: self.schema["ui"][k] for k in ui_order}
-        self.schema["ui"] = reordered_dict
+        self.schema["ui"] = reorder_dict_skip_missing(self.schema["ui"], ui_order)
 
     def write(self, output_dir):
-        with open(os.path.join(output_dir, self.schema_file), "w") as ff:
-            json.dump(self.schema, ff, sort_keys=False, indent=4)
+        # encode first so a failure does not truncate an existing file
+        buf = _dumps(self.schema)
+        with open(os.path.join(output_dir, self.schema_file), "wb") as ff:
+            ff.write(buf)
 
     @classmethod
     def from_data(cls, data):
@@ -66,14 +123,14 @@ class SchemaBase:
             raise ValueError("SchemaBase cannot be used to instantiate class")
         if cls.schema_type != data["@type"]:
             raise ValueError(f"Mismatch in type {data['@type']} != {cls.schema_type}")
-        klass = cls()
+        # the default schema built by __init__ would be discarded right away
+        klass = cls.__new__(cls)
         klass.schema = data
         return klass
 
     @classmethod
     def from_file(cls, filepath):
-        with open(filepath) as fp:
-            data = json.load(fp)
+        data = load_json_bytes(Path(filepath).read_bytes())
         if "@type" not in data:
             raise ValueError("Missing @type key")
         return cls.from_data(data)
@@ -1,4 +1,4 @@
-from .base import SchemaBase
+from .base import SchemaBase, URL, DEFAULT_LANG
 
 
 class Item(SchemaBase):
@@ -7,6 +7,8 @@ class Item(SchemaBase):
     """
 
     schema_type = "reproschema:Field"
+    schema_order = SchemaBase.schema_order + ("ui", "question", "responseOptions")
+    __slots__ = ("URI",)
 
     def __init__(self, version=None):
         super().__init__(version)
@@ -29,7 +31,7 @@ class Item(SchemaBase):
         self.schema["@id"] = name
         self.set_input_type_as_char()
 
-    def set_question(self, question, lang="en"):
+    def set_question(self, question, lang=DEFAULT_LANG):
         self.schema["question"][lang] = question
 
     def set_input_type(self, input_type):
@@ -59,8 +61,6 @@ class Item(SchemaBase):
 
     def set_input_type_as_language(self):
 
-        URL = "https://raw.githubusercontent.com/ReproNim/reproschema/"
-
         self.set_input_type("selectLanguage")
 
         response_options = {
@@ -124,9 +124,6 @@ class Item(SchemaBase):
 
     def set_basic_response_type(self, response_type):
 
-        # default (also valid for "char" input type)
-        self.set_input_type_as_char()
-
         if response_type == "int":
             self.set_input_type_as_int()
 
@@ -142,17 +139,9 @@ class Item(SchemaBase):
         elif response_type == "language":
             self.set_input_type_as_language()
 
+        # default (also valid for "char" input type)
+        else:
+            self.set_input_type_as_char()
+
     def sort(self):
-        schema_order = [
-            "@context",
-            "@type",
-            "@id",
-            "prefLabel",
-            "description",
-            "schemaVersion",
-            "version",
-            "ui",
-            "question",
-            "responseOptions",
-        ]
-        self.sort_schema(schema_order)
+        self.sort_schema(self.schema_order)
@@ -1,4 +1,4 @@
-from .base import SchemaBase
+from .base import SchemaBase, DEFAULT_LANG
 
 
 class Protocol(SchemaBase):
@@ -7,6 +7,9 @@ class Protocol(SchemaBase):
     """
 
     schema_type = "reproschema:Protocol"
+    schema_order = SchemaBase.schema_order + ("landingPage", "ui")
+    ui_order = ("allow", "shuffle", "order", "addProperties")
+    __slots__ = ()
 
     def __init__(self, version=None):
         super().__init__(version)
@@ -17,7 +20,7 @@ class Protocol(SchemaBase):
             "addProperties": [],
         }
 
-    def set_landing_page(self, landing_page_url, lang="en"):
+    def set_landing_page(self, landing_page_url, lang=DEFAULT_LANG):
         self.schema["landingPage"] = {"@id": landing_page_url, "inLanguage": lang}
 
     # TODO
@@ -49,30 +52,19 @@ class Protocol(SchemaBase):
         # - remove the hard coding on visibility and valueRequired
 
         # update the content of the protocol with this new activity
+        URI = activity.get_URI()
         append_to_protocol = {
             "variableName": activity.get_name(),
-            "isAbout": activity.get_URI(),
-            "prefLabel": {"en": activity.schema["prefLabel"]},
+            "isAbout": URI,
+            "prefLabel": {DEFAULT_LANG: activity.schema["prefLabel"]},
             "isVis": True,
             "valueRequired": False,
         }
 
-        self.schema["ui"]["order"].append(activity.URI)
-        self.schema["ui"]["addProperties"].append(append_to_protocol)
+        ui = self.schema["ui"]
+        ui["order"].append(URI)
+        ui["addProperties"].append(append_to_protocol)
 
     def sort(self):
-        schema_order = [
-            "@context",
-            "@type",
-            "@id",
-            "prefLabel",
-            "description",
-            "schemaVersion",
-            "version",
-            "landingPage",
-            "ui",
-        ]
-        self.sort_schema(schema_order)
-
-        ui_order = ["allow", "shuffle", "order", "addProperties"]
-        self.sort_ui(ui_order)
+        self.sort_schema(self.schema_order)
+        self.sort_ui(self.ui_order)
@@ -1,3 +1,4 @@
+import pytest
 from .. import Protocol, Activity, Item
 
 
@@ -17,4 +18,101 @@ def test_constructors():
 def test_constructors_from_data():
     Protocol.from_data({"@type": "reproschema:Protocol"})
     Activity.from_data({"@type": "reproschema:Activity"})
-    Item.from_data({"@type": "reproschema:Field"})
+    item = Item.from_data({"@type": "reproschema:Field"})
+    assert item.schema == {"@type": "reproschema:Field"}
+    with pytest.raises(ValueError):
+        Item.from_data({"@type": "reproschema:Activity"})
+
+
+def test_write_roundtrip(tmp_path):
+    act = Activity()
+    act.set_filename("activity1")
+    act.set_pref_label("activity 1")
+    act.set_description("activity 1")
+    act.sort()
+    act.write(tmp_path)
+    loaded = Activity.from_file(tmp_path / "activity1_schema")
+    assert loaded.schema == act.schema
+
+
+def test_write_non_str_keys(tmp_path):
+    item = Item()
+    item.set_filename("item1")
+    item.set_response_options({"choices": {0: "no", 1: "yes"}})
+    item.write(tmp_path)
+    loaded = Item.from_file(tmp_path / "item1_schema")
+    assert loaded.schema["responseOptions"] == {"choices": {"0": "no", "1": "yes"}}
+
+
+def test_write_failure_keeps_existing_file(tmp_path):
+    item = Item()
+    item.set_filename("item1")
+    item.write(tmp_path)
+    before = (tmp_path / "item1_schema").read_bytes()
+    item.set_response_options({"valueType": object()})
+    with pytest.raises(TypeError):
+        item.write(tmp_path)
+    assert (tmp_path / "item1_schema").read_bytes() == before
+
+
+def test_set_basic_response_type():
+    item = Item()
+    item.set_basic_response_type("int")
+    assert item.schema["ui"]["inputType"] == "number"
+    assert item.schema["responseOptions"] == {"valueType": "xsd:integer"}
+    item.set_basic_response_type("char")
+    assert item.schema["ui"]["inputType"] == "text"
+    assert item.schema["responseOptions"] == {"valueType": "xsd:string"}
+
+
+def test_sort_skips_missing_keys():
+    item = Item()
+    item.sort()
+    assert list(item.schema) == [
+        "@context",
+        "@type",
+        "schemaVersion",
+        "version",
+        "ui",
+        "question",
+        "responseOptions",
+    ]
+
+
+def test_filename():
+    act = Activity()
+    act.set_filename("my_schema_activity")
+    assert act.get_filename() == "my_schema_activity_schema"
+    assert act.schema["@id"] == "my_schema_activity_schema"
+    assert act.get_name() == "my_schema_activity"
+    act.schema_file = "activity2"
+    assert act.get_name() == "activity2"
+
+
+def test_append_activity():
+    act = Activity()
+    act.set_filename("activity1")
+    act.set_pref_label("activity 1")
+    act.set_URI("activities/activity1_schema")
+    act.update_activity({"name": "item1", "visibility": True})
+    assert act.schema["ui"]["order"] == ["items/item1"]
+
+    proto = Protocol()
+    proto.append_activity(act)
+    assert proto.schema["ui"]["order"] == ["activities/activity1_schema"]
+    assert proto.schema["ui"]["addProperties"][0]["variableName"] == "activity1"
+
+
+@pytest.mark.parametrize("klass", [Protocol, Activity, Item])
+def test_slots_cover_setters(klass):
+    obj = klass()
+    obj.set_directory("output")
+    obj.set_filename("name")
+    obj.set_pref_label("name")
+    obj.set_description("name")
+    if hasattr(obj, "set_URI"):
+        obj.set_URI("name_schema")
+        assert obj.URI == "name_schema"
+    assert obj.dir == "output"
+    assert obj.get_filename() == "name_schema"
+    assert not hasattr(obj, "__dict__")
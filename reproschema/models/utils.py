@@ -1,10 +1,10 @@
-import json
+from pathlib import Path
 from . import Protocol, Activity, Item
+from .base import load_json_bytes
 
 
 def load_schema(filepath):
-    with open(filepath) as fp:
-        data = json.load(fp)
+    data = load_json_bytes(Path(filepath).read_bytes())
     if "@type" not in data:
         raise ValueError("Missing @type key")
     schema_type = data["@type"]
@@ -1,5 +1,6 @@
 import os
 from ..validate import validate_dir, validate
+from ..jsonldutils import load_file, validate_data
 import pytest
 
 
@@ -14,6 +15,16 @@ def test_type_error():
         validate_dir("contexts", os.path.abspath("reproschema-shacl.ttl"))
 
 
+def test_validate_data_twice():
+    os.chdir(os.path.dirname(__file__))
+    shape_file = os.path.abspath("reproschema-shacl.ttl")
+    data = load_file(os.path.join("data", "activities", "items", "item1.jsonld"))
+    first = validate_data(data, shape_file)
+    second = validate_data(data, shape_file)
+    assert first[0]
+    assert first == second
+
+
 def test_url():
     url = "https://raw.githubusercontent.com/ReproNim/reproschema/1.0.0-rc1/examples/activities/activity1.jsonld"
     assert validate(os.path.abspath("reproschema-shacl.ttl"), url)